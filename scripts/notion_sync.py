@@ -13,14 +13,17 @@ will merely log the actions without performing any outbound HTTP requests.
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import os
-from dataclasses import dataclass
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Protocol, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 LOGGER = logging.getLogger("notion_sync")
 
@@ -47,19 +50,29 @@ class NotionClient:
     api_version: str = "2022-06-28"
 
     base_url: str = "https://api.notion.com/v1"
-
-    def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
-        headers = kwargs.pop("headers", {})
-        session = requests.Session()
-        session.headers.update(
+    pool_size: int = 10
+    timeout: Tuple[float, float] = (5.0, 10.0)
+    _session: requests.Session = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # A single session keeps the TLS connection to the API alive across calls;
+        # the pool is sized so concurrent dispatch never discards kept-alive sockets.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size))
+        self._session.headers.update(
             {
                 "Authorization": f"Bearer {self.token}",
                 "Notion-Version": self.api_version,
                 "Content-Type": "application/json",
             }
         )
-        session.headers.update(headers)
-        response = session.request(method, f"{self.base_url}/{endpoint}", **kwargs)
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        kwargs.setdefault("timeout", self.timeout)
+        response = self._session.request(method, f"{self.base_url}/{endpoint}", **kwargs)
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:  # pragma: no cover - passthrough to provide context
@@ -98,21 +111,29 @@ class NotionSyncDispatcher:
         *,
         dry_run: bool = False,
         logger: Optional[logging.Logger] = None,
+        copy_payload: bool = False,
     ) -> Dict[str, Any]:
+        """Run ``action`` and return a record describing it.
+
+        The returned record references ``payload`` directly unless
+        ``copy_payload`` is set, so callers must not mutate the payload after
+        dispatch when relying on the record.
+        """
         logger = logger or LOGGER
-        if action not in self._handlers:
+        handler = self._handlers.get(action)
+        if handler is None:
             raise NotionSyncError(f"No handler registered for action '{action}'")
 
         if dry_run:
-            logger.info("[DRY-RUN] Action '%s' would run with payload: %s", action, json.dumps(payload, sort_keys=True))
-            return {"action": action, "payload": dict(payload), "dry_run": True}
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("[DRY-RUN] Action '%s' would run with payload: %s", action, json.dumps(payload, sort_keys=True))
+            return {"action": action, "payload": dict(payload) if copy_payload else payload, "dry_run": True}
 
-        handler = self._handlers[action]
         try:
             handler(client, payload)
         except Exception as exc:  # pragma: no cover - defensive guard
             raise NotionSyncError(f"Handler '{action}' failed") from exc
-        return {"action": action, "payload": dict(payload), "dry_run": False}
+        return {"action": action, "payload": dict(payload) if copy_payload else payload, "dry_run": False}
 
 
 def update_page_handler(client: NotionClientProtocol, payload: Mapping[str, Any]) -> None:
@@ -138,7 +159,13 @@ def build_default_dispatcher() -> NotionSyncDispatcher:
     return dispatcher
 
 
-def load_sync_plan(plan_path: Optional[Path], raw_plan: Optional[str], logger: logging.Logger) -> List[MutableMapping[str, Any]]:
+def load_sync_plan(
+    plan_path: Optional[Path],
+    raw_plan: Optional[str],
+    logger: logging.Logger,
+    *,
+    copy_payloads: bool = False,
+) -> List[MutableMapping[str, Any]]:
     if raw_plan:
         logger.debug("Loading sync plan from NOTION_SYNC_PLAN environment variable")
         data = json.loads(raw_plan)
@@ -155,15 +182,58 @@ def load_sync_plan(plan_path: Optional[Path], raw_plan: Optional[str], logger: l
 
     actions: List[MutableMapping[str, Any]] = []
     for idx, item in enumerate(data):
-        if not isinstance(item, MutableMapping) or "action" not in item:
+        # Parsed JSON always yields plain dicts; only fall back to the slower
+        # ABC check for other mapping types.
+        if (type(item) is not dict and not isinstance(item, MutableMapping)) or "action" not in item:
             raise NotionSyncError(f"Invalid sync plan entry at index {idx}: {item!r}")
         payload = item.get("payload", {})
-        if not isinstance(payload, MutableMapping):
+        if type(payload) is not dict and not isinstance(payload, MutableMapping):
             raise NotionSyncError(f"Payload for action at index {idx} must be a mapping")
-        actions.append({"action": item["action"], "payload": dict(payload)})
+        actions.append({"action": item["action"], "payload": dict(payload) if copy_payloads else payload})
     return actions
 
 
+_DEDUPE_TARGET_FIELDS: Dict[str, str] = {"update_page": "page_id", "update_database": "database_id"}
+
+
+def dedupe_sync_plan(plan: Iterable[MutableMapping[str, Any]]) -> List[MutableMapping[str, Any]]:
+    """Collapse repeated updates of the same page or database into a single action.
+
+    Properties from later entries override earlier ones and the merged action
+    keeps the position of the first entry for its target.  Other actions, and
+    entries whose target id is unhashable or whose properties are not a
+    mapping, are passed through unchanged for the handlers to reject.
+    """
+    deduped: List[MutableMapping[str, Any]] = []
+    positions: Dict[Tuple[str, Any], int] = {}
+    for item in plan:
+        action = item["action"]
+        payload = item.get("payload", {})
+        target_field = _DEDUPE_TARGET_FIELDS.get(action)
+        target = payload.get(target_field) if target_field else None
+        if not target:
+            deduped.append(item)
+            continue
+        key = (action, target)
+        try:
+            idx = positions.get(key)
+        except TypeError:  # unhashable target id, e.g. a list
+            deduped.append(item)
+            continue
+        previous = deduped[idx]["payload"] if idx is not None else None
+        previous_properties = previous.get("properties", {}) if previous is not None else None
+        properties = payload.get("properties", {})
+        if not isinstance(previous_properties, Mapping) or not isinstance(properties, Mapping):
+            # First entry for the target, or one that cannot be merged: later
+            # updates fold into this newest entry, keeping last-write order.
+            positions[key] = len(deduped)
+            deduped.append(item)
+            continue
+        merged = {**previous_properties, **properties}
+        deduped[idx] = {"action": action, "payload": {**previous, **payload, "properties": merged}}
+    return deduped
+
+
 def execute_sync_plan(
     plan: Iterable[Mapping[str, Any]],
     dispatcher: NotionSyncDispatcher,
@@ -171,26 +241,75 @@ def execute_sync_plan(
     *,
     dry_run: bool,
     logger: Optional[logging.Logger] = None,
+    max_parallel: int = 1,
+    copy_payload: bool = False,
 ) -> List[Dict[str, Any]]:
+    """Dispatch every action in ``plan`` and return the results in plan order.
+
+    Live runs with ``max_parallel`` greater than one keep up to that many
+    requests in flight, so the actions in such plans must be independent of
+    each other.
+    """
     logger = logger or LOGGER
-    results: List[Dict[str, Any]] = []
-    for item in plan:
+    items = list(plan)
+    if not items:
+        logger.info("Sync plan was empty - no actions executed")
+        return []
+
+    def _dispatch(item: Mapping[str, Any]) -> Dict[str, Any]:
         action = item["action"]
         payload = item.get("payload", {})
         logger.debug("Dispatching action '%s'", action)
-        result = dispatcher.dispatch(action, client, payload, dry_run=dry_run, logger=logger)
-        results.append(result)
-    if not plan:
-        logger.info("Sync plan was empty - no actions executed")
-    return results
+        return dispatcher.dispatch(action, client, payload, dry_run=dry_run, logger=logger, copy_payload=copy_payload)
 
+    workers = min(max_parallel, len(items))
+    if dry_run or workers <= 1:
+        return [_dispatch(item) for item in items]
 
-def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_dispatch, item) for item in items]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        # Once an action fails, drop everything still queued, as the serial path
+        # would.  Queued futures come after every started one, so the loop below
+        # raises the failure rather than a CancelledError.
+        executor.shutdown(cancel_futures=True)
+        return [future.result() for future in futures]
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Synchronise configuration with Notion")
     parser.add_argument("--plan", type=Path, default=Path("config/notion_sync_plan.json"), help="Path to the sync plan JSON file")
     parser.add_argument("--dry-run", action="store_true", help="Log intended actions without performing API calls")
+    parser.add_argument(
+        "--max-parallel",
+        type=_positive_int,
+        default=1,
+        help="Maximum number of independent actions to send to Notion concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--safe-copy",
+        action="store_true",
+        help="Copy every payload while loading and dispatching the plan instead of sharing the parsed objects",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Merge repeated updates of the same page or database into a single API call",
+    )
     parser.add_argument("--log-level", default="INFO", help="Python logging level (default: INFO)")
-    return parser.parse_args(list(argv) if argv is not None else None)
+    return parser
+
+
+def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(list(argv) if argv is not None else None)
 
 
 def configure_logging(level: str) -> None:
@@ -202,7 +321,12 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     configure_logging(args.log_level)
 
     raw_plan = os.getenv("NOTION_SYNC_PLAN")
-    plan = load_sync_plan(args.plan, raw_plan, LOGGER)
+    plan = load_sync_plan(args.plan, raw_plan, LOGGER, copy_payloads=args.safe_copy)
+    if args.dedupe:
+        deduped = dedupe_sync_plan(plan)
+        if len(deduped) != len(plan):
+            LOGGER.info("Merged %d duplicate action(s) in the sync plan", len(plan) - len(deduped))
+        plan = deduped
 
     dispatcher = build_default_dispatcher()
 
@@ -212,9 +336,21 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         token = os.getenv("NOTION_API_TOKEN")
         if not token:
             raise NotionSyncError("NOTION_API_TOKEN environment variable is required for real sync runs")
-        client = NotionClient(token=token)
-
-    execute_sync_plan(plan, dispatcher, client, dry_run=args.dry_run, logger=LOGGER)
+        client = NotionClient(token=token, pool_size=args.max_parallel)
+
+    try:
+        execute_sync_plan(
+            plan,
+            dispatcher,
+            client,
+            dry_run=args.dry_run,
+            logger=LOGGER,
+            max_parallel=args.max_parallel,
+            copy_payload=args.safe_copy,
+        )
+    finally:
+        if isinstance(client, NotionClient):
+            client.close()
     return 0
 
 
@@ -1,13 +1,18 @@
 import logging
+import time
 from typing import Mapping
 
 import pytest
 
 from scripts.notion_sync import (
     DummyClient,
+    NotionClient,
     NotionSyncDispatcher,
     NotionSyncError,
+    _build_parser,
+    dedupe_sync_plan,
     execute_sync_plan,
+    parse_args,
 )
 
 
@@ -49,6 +54,17 @@ def test_dispatcher_logs_dry_run(caplog) -> None:
     assert result["dry_run"] is True
 
 
+def test_dispatcher_skips_dry_run_preview_below_info(caplog) -> None:
+    caplog.set_level(logging.WARNING)
+    dispatcher = NotionSyncDispatcher({"example": lambda c, p: None})
+
+    # The payload is not JSON serialisable, so building the preview would raise.
+    result = dispatcher.dispatch("example", object(), {"client": object()}, dry_run=True)
+
+    assert caplog.text == ""
+    assert result["dry_run"] is True
+
+
 def test_dispatcher_unknown_action_raises() -> None:
     dispatcher = NotionSyncDispatcher()
 
@@ -95,3 +111,136 @@ def test_execute_sync_plan_invokes_handlers_in_order() -> None:
         ("db1", {"Name": {"title": [{"text": {"content": "Item"}}]}})
     ]
     assert [item["action"] for item in results] == ["update_page", "update_database"]
+
+
+def test_notion_client_reuses_session_across_requests(monkeypatch) -> None:
+    calls = []
+
+    class _Response:
+        content = b""
+
+        def raise_for_status(self) -> None:
+            return None
+
+    client = NotionClient(token="secret")
+    monkeypatch.setattr(
+        client._session,
+        "request",
+        lambda method, url, **kwargs: calls.append((method, url, kwargs["timeout"])) or _Response(),
+    )
+    session = client._session
+
+    client.update_page("abc", {})
+    client.update_database("db1", {})
+
+    assert client._session is session
+    assert session.headers["Authorization"] == "Bearer secret"
+    assert calls == [
+        ("patch", "https://api.notion.com/v1/pages/abc", (5.0, 10.0)),
+        ("patch", "https://api.notion.com/v1/databases/db1", (5.0, 10.0)),
+    ]
+
+
+def test_notion_client_sizes_connection_pool() -> None:
+    client = NotionClient(token="secret", pool_size=8)
+
+    adapter = client._session.get_adapter("https://api.notion.com/v1/pages/abc")
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 8
+
+
+def test_execute_sync_plan_parallel_preserves_result_order() -> None:
+    dispatcher = NotionSyncDispatcher()
+    client = _RecordingClient()
+    dispatcher.register("update_page", lambda client, payload: client.update_page(payload["page_id"], payload["properties"]))
+
+    plan = [{"action": "update_page", "payload": {"page_id": f"page-{idx}", "properties": {}}} for idx in range(20)]
+
+    results = execute_sync_plan(plan, dispatcher, client, dry_run=False, logger=logging.getLogger("test"), max_parallel=8)
+
+    assert [item["payload"]["page_id"] for item in results] == [f"page-{idx}" for idx in range(20)]
+    assert sorted(page_id for page_id, _ in client.page_updates) == sorted(f"page-{idx}" for idx in range(20))
+
+
+def test_execute_sync_plan_parallel_stops_after_failure() -> None:
+    started = []
+
+    def handler(client, payload):
+        started.append(payload["idx"])
+        if payload["idx"] == 0:
+            time.sleep(0.2)
+        elif payload["idx"] == 1:
+            raise ValueError("boom")
+
+    dispatcher = NotionSyncDispatcher({"example": handler})
+    plan = [{"action": "example", "payload": {"idx": idx}} for idx in range(100)]
+
+    with pytest.raises(NotionSyncError) as exc:
+        execute_sync_plan(plan, dispatcher, object(), dry_run=False, logger=logging.getLogger("test"), max_parallel=2)
+
+    assert "Handler 'example' failed" in str(exc.value)
+    assert len(started) < 10
+
+
+def test_parse_args_rejects_non_positive_max_parallel() -> None:
+    for value in ("0", "-1"):
+        with pytest.raises(SystemExit):
+            parse_args(["--max-parallel", value])
+
+
+def test_dispatcher_copies_payload_only_when_requested() -> None:
+    dispatcher = NotionSyncDispatcher({"example": lambda c, p: None})
+    payload = {"foo": "bar"}
+
+    shared = dispatcher.dispatch("example", object(), payload)
+    copied = dispatcher.dispatch("example", object(), payload, copy_payload=True)
+
+    assert shared["payload"] is payload
+    assert copied["payload"] == payload
+    assert copied["payload"] is not payload
+
+
+def test_dedupe_sync_plan_merges_updates_to_the_same_target() -> None:
+    plan = [
+        {"action": "update_page", "payload": {"page_id": "abc", "properties": {"Status": "Draft", "Owner": "ops"}}},
+        {"action": "custom", "payload": {"page_id": "abc"}},
+        {"action": "update_database", "payload": {"database_id": "abc", "properties": {"Name": "Item"}}},
+        {"action": "update_page", "payload": {"page_id": "abc", "properties": {"Status": "Live"}}},
+    ]
+
+    deduped = dedupe_sync_plan(plan)
+
+    assert deduped == [
+        {"action": "update_page", "payload": {"page_id": "abc", "properties": {"Status": "Live", "Owner": "ops"}}},
+        {"action": "custom", "payload": {"page_id": "abc"}},
+        {"action": "update_database", "payload": {"database_id": "abc", "properties": {"Name": "Item"}}},
+    ]
+    assert plan[0]["payload"]["properties"]["Status"] == "Draft"
+
+
+def test_dedupe_sync_plan_passes_through_unhashable_targets() -> None:
+    plan = [
+        {"action": "update_page", "payload": {"page_id": ["a"], "properties": {}}},
+        {"action": "update_page", "payload": {"page_id": ["a"], "properties": {}}},
+    ]
+
+    assert dedupe_sync_plan(plan) == plan
+
+
+def test_dedupe_sync_plan_does_not_merge_non_mapping_properties() -> None:
+    plan = [
+        {"action": "update_page", "payload": {"page_id": "abc", "properties": {"Status": "Draft"}}},
+        {"action": "update_page", "payload": {"page_id": "abc", "properties": [1]}},
+        {"action": "update_page", "payload": {"page_id": "abc", "properties": {"Status": "Live"}}},
+    ]
+
+    assert dedupe_sync_plan(plan) == plan
+
+
+def test_parse_args_reuses_parser_between_calls() -> None:
+    first = parse_args(["--dry-run", "--max-parallel", "4"])
+    second = parse_args([])
+
+    assert (first.dry_run, first.max_parallel) == (True, 4)
+    assert (second.dry_run, second.max_parallel) == (False, 1)
+    assert _build_parser() is _build_parser()